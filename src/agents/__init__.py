@@ -1 +1,23 @@
+import os
+import threading
+from functools import lru_cache
 
+# CrewAI's verbose output prints every agent step to stdout; opt in with LEADENRICHER_VERBOSE=1
+VERBOSE = os.getenv("LEADENRICHER_VERBOSE", "0") == "1"
+
+_firecrawl_tools_lock = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _create_firecrawl_tools() -> tuple:
+    from crewai_tools import FirecrawlScrapeWebsiteTool, FirecrawlSearchTool
+    
+    return FirecrawlScrapeWebsiteTool(), FirecrawlSearchTool()
+
+
+def firecrawl_tools() -> list:
+    """Return the Firecrawl scrape and search tools shared by every agent."""
+    # The tools set up an authenticated client when constructed, so build them once;
+    # the lock keeps agents created concurrently from each constructing their own
+    with _firecrawl_tools_lock:
+        return list(_create_firecrawl_tools())
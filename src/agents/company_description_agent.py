@@ -1,12 +1,9 @@
 from crewai import Agent
-from crewai_tools import FirecrawlScrapeWebsiteTool, FirecrawlSearchTool
+from . import VERBOSE, firecrawl_tools
 
 def create_company_description_agent() -> Agent:
     """Create agent specialized in researching and creating company descriptions."""
     
-    scrape_tool = FirecrawlScrapeWebsiteTool()
-    search_tool = FirecrawlSearchTool()
-    
     return Agent(
         role="Company Description Research Specialist",
         goal="Research companies and create concise, accurate descriptions of what they do",
@@ -14,8 +11,8 @@ def create_company_description_agent() -> Agent:
         company operations and creating clear, concise descriptions. You excel at identifying 
         the core services and business model from various sources and distilling complex 
         business information into simple, understandable descriptions.""",
-        tools=[scrape_tool, search_tool],
-        verbose=True,
+        tools=firecrawl_tools(),
+        verbose=VERBOSE,
         allow_delegation=False,
         instructions="""
         RESEARCH FOCUS AREAS:
@@ -1,21 +1,18 @@
 from crewai import Agent
-from crewai_tools import FirecrawlScrapeWebsiteTool, FirecrawlSearchTool
 from ..models.schemas import CompanyProfileResult
+from . import VERBOSE, firecrawl_tools
 
 def create_company_profile_agent() -> Agent:
     """Create the Company Profile Agent responsible for extracting detailed company information."""
     
-    scrape_tool = FirecrawlScrapeWebsiteTool()
-    search_tool = FirecrawlSearchTool()
-    
     return Agent(
         role="Company Profile Research Specialist",
         goal="Extract comprehensive company profile information including industry, size, leadership, and background",
         backstory="""You are a business research expert who specializes in building detailed company profiles. 
         You excel at finding information about company structure, industry classification, leadership teams, 
         and corporate background through systematic research across authoritative business sources.""",
-        tools=[scrape_tool, search_tool],
-        verbose=True,
+        tools=firecrawl_tools(),
+        verbose=VERBOSE,
         allow_delegation=False,
         instructions="""
         RESEARCH FOCUS AREAS:
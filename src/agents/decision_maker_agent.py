@@ -1,20 +1,17 @@
 from crewai import Agent
-from crewai_tools import FirecrawlScrapeWebsiteTool, FirecrawlSearchTool
+from . import VERBOSE, firecrawl_tools
 
 def create_decision_maker_agent() -> Agent:
     """Create agent specialized in validating decision maker status."""
     
-    scrape_tool = FirecrawlScrapeWebsiteTool()
-    search_tool = FirecrawlSearchTool()
-    
     return Agent(
         role="Decision Maker Validation Specialist",
         goal="Validate whether individuals are decision makers within their organizations",
         backstory="""You are an expert at analyzing organizational hierarchies and determining 
         decision-making authority within companies. You understand corporate structures, job titles, 
         and roles to identify who has purchasing power and strategic decision-making authority.""",
-        tools=[scrape_tool, search_tool],
-        verbose=True,
+        tools=firecrawl_tools(),
+        verbose=VERBOSE,
         allow_delegation=False,
         instructions="""
         DECISION MAKER CRITERIA:
@@ -1,19 +1,16 @@
 from crewai import Agent
-from crewai_tools import FirecrawlScrapeWebsiteTool, FirecrawlSearchTool
+from . import VERBOSE, firecrawl_tools
 
 def create_discovery_agent() -> Agent:
     """Create the Discovery Agent responsible for extracting foundational company information."""
     
-    scrape_tool = FirecrawlScrapeWebsiteTool()
-    search_tool = FirecrawlSearchTool()
-    
     return Agent(
         role="Company Discovery Specialist",
         goal="Extract foundational company information from email domains with high accuracy and confidence",
         backstory="""You are an expert at discovering and extracting basic company information from email addresses. 
         You specialize in finding company names, websites, descriptions, and basic details through systematic research 
         and verification across multiple sources.""",
-        tools=[scrape_tool, search_tool],
-        verbose=True,
+        tools=firecrawl_tools(),
+        verbose=VERBOSE,
         allow_delegation=False
     )
@@ -1,20 +1,17 @@
 from crewai import Agent
-from crewai_tools import FirecrawlScrapeWebsiteTool, FirecrawlSearchTool
+from . import VERBOSE, firecrawl_tools
 
 def create_email_research_agent() -> Agent:
     """Create agent specialized in finding missing email addresses."""
     
-    scrape_tool = FirecrawlScrapeWebsiteTool()
-    search_tool = FirecrawlSearchTool()
-    
     return Agent(
         role="Email Research Specialist",
         goal="Find missing personal and business email addresses through comprehensive web research",
         backstory="""You are an expert at finding contact information through systematic research 
         across LinkedIn profiles, company websites, business directories, and professional networks. 
         You excel at identifying patterns and using multiple sources to verify email addresses.""",
-        tools=[scrape_tool, search_tool],
-        verbose=True,
+        tools=firecrawl_tools(),
+        verbose=VERBOSE,
         allow_delegation=False,
         instructions="""
         EMAIL RESEARCH STRATEGIES:
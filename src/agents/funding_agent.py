@@ -1,21 +1,18 @@
 from crewai import Agent
-from crewai_tools import FirecrawlScrapeWebsiteTool, FirecrawlSearchTool
 from ..models.schemas import FundingResult
+from . import VERBOSE, firecrawl_tools
 
 def create_funding_agent() -> Agent:
     """Create the Funding Agent responsible for extracting investment and funding information."""
     
-    scrape_tool = FirecrawlScrapeWebsiteTool()
-    search_tool = FirecrawlSearchTool()
-    
     return Agent(
         role="Investment Research Specialist",
         goal="Extract comprehensive funding and investment information including rounds, amounts, and investors",
         backstory="""You are a financial research expert specializing in startup and company funding analysis. 
         You excel at tracking investment rounds, identifying investors, and understanding funding histories 
         through systematic research across financial databases and news sources.""",
-        tools=[scrape_tool, search_tool],
-        verbose=True,
+        tools=firecrawl_tools(),
+        verbose=VERBOSE,
         allow_delegation=False,
         instructions="""
         FUNDING RESEARCH AREAS:
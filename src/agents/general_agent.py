@@ -1,21 +1,18 @@
 from crewai import Agent
-from crewai_tools import FirecrawlScrapeWebsiteTool, FirecrawlSearchTool
 from ..models.schemas import GeneralResult
+from . import VERBOSE, firecrawl_tools
 
 def create_general_agent() -> Agent:
     """Create the General Agent responsible for extracting any additional requested information."""
     
-    scrape_tool = FirecrawlScrapeWebsiteTool()
-    search_tool = FirecrawlSearchTool()
-    
     return Agent(
         role="General Research Specialist",
         goal="Extract any additional requested information that doesn't fit into other specialized categories",
         backstory="""You are a versatile research expert capable of finding and extracting any type of information 
         about companies. You adapt your research methods based on the specific information requested and excel 
         at comprehensive data gathering across diverse sources and topics.""",
-        tools=[scrape_tool, search_tool],
-        verbose=True,
+        tools=firecrawl_tools(),
+        verbose=VERBOSE,
         allow_delegation=False,
         instructions="""
         GENERAL RESEARCH APPROACH:
@@ -1,21 +1,18 @@
 from crewai import Agent
-from crewai_tools import FirecrawlScrapeWebsiteTool, FirecrawlSearchTool
 from ..models.schemas import MetricsResult
+from . import VERBOSE, firecrawl_tools
 
 def create_metrics_agent() -> Agent:
     """Create the Metrics Agent responsible for extracting business metrics and performance data."""
     
-    scrape_tool = FirecrawlScrapeWebsiteTool()
-    search_tool = FirecrawlSearchTool()
-    
     return Agent(
         role="Business Metrics Research Specialist",
         goal="Extract quantitative business metrics including revenue, employee count, growth rates, and valuation",
         backstory="""You are a business intelligence expert who specializes in gathering quantitative metrics 
         about companies. You excel at finding financial performance data, growth metrics, market position, 
         and operational statistics through systematic research across business and financial sources.""",
-        tools=[scrape_tool, search_tool],
-        verbose=True,
+        tools=firecrawl_tools(),
+        verbose=VERBOSE,
         allow_delegation=False,
         instructions="""
         METRICS RESEARCH AREAS:
@@ -1,21 +1,18 @@
 from crewai import Agent
-from crewai_tools import FirecrawlScrapeWebsiteTool, FirecrawlSearchTool
 from ..models.schemas import TechStackResult
+from . import VERBOSE, firecrawl_tools
 
 def create_tech_stack_agent() -> Agent:
     """Create the Tech Stack Agent responsible for extracting technology and infrastructure information."""
     
-    scrape_tool = FirecrawlScrapeWebsiteTool()
-    search_tool = FirecrawlSearchTool()
-    
     return Agent(
         role="Technology Research Specialist",
         goal="Extract comprehensive technology stack information including programming languages, frameworks, and infrastructure",
         backstory="""You are a technology research expert who specializes in identifying the technical infrastructure 
         and tools used by companies. You excel at discovering programming languages, frameworks, databases, 
         cloud services, and development tools through systematic analysis of technical sources.""",
-        tools=[scrape_tool, search_tool],
-        verbose=True,
+        tools=firecrawl_tools(),
+        verbose=VERBOSE,
         allow_delegation=False,
         instructions="""
         TECHNOLOGY RESEARCH AREAS:
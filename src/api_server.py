@@ -4,19 +4,51 @@ FastAPI server to expose Python backend functionality to Next.js frontend.
 """
 
 import asyncio
-import json
+import csv
+import io
 import os
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import Callable, List, Dict, Any, Optional, Tuple
 
+import anyio.to_thread
 import uvicorn
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from .lead_enricher import LeadEnricher
-from .models.schemas import EnrichmentField, FieldType, EnrichmentResult
+from .lead_enricher import LEAD_CSV_WRITE_OPTIONS, THREADPOOL_SIZE, LeadEnricher
+from .public_email_domains import EMAIL_RE, PUBLIC_EMAIL_DOMAINS
+from .responses import ORJSONResponse, SSE_HEADERS, SSE_MEDIA_TYPE, sse
+from .models.schemas import (
+    EnrichmentField, FieldType, EnrichmentResult,
+    DiscoveryResult, CompanyProfileResult, FundingResult, TechStackResult, MetricsResult
+)
+
+# Maximum number of CSV rows enriched concurrently
+CSV_CONCURRENCY = 8
+
+# Agent result attributes on EnrichmentResult, in merge precedence order
+AGENT_RESULT_MODELS = {
+    'discovery': DiscoveryResult,
+    'company_profile': CompanyProfileResult,
+    'funding': FundingResult,
+    'tech_stack': TechStackResult,
+    'metrics': MetricsResult,
+}
+AGENT_RESULT_ATTRS = (*AGENT_RESULT_MODELS, 'general')
+
+# Field name keyword classifiers, checked in priority order
+FIELD_TYPE_CLASSIFIERS = (
+    (re.compile(r'fund|invest|capital|series'), FieldType.FUNDING),
+    (re.compile(r'tech|stack|language|framework'), FieldType.TECH_STACK),
+    (re.compile(r'revenue|employee|size|metric'), FieldType.METRICS),
+    (re.compile(r'industry|headquarter|location'), FieldType.COMPANY_PROFILE),
+)
 
 
 class EnrichmentRequest(BaseModel):
@@ -46,8 +78,13 @@ enricher: Optional[LeadEnricher] = None
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize the enricher on startup."""
+    """Initialize the enricher and worker threadpools on startup."""
     global enricher
+    
+    # asyncio.to_thread uses the loop's default executor; Starlette's threadpool uses anyio's limiter
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=THREADPOOL_SIZE))
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    
     try:
         enricher = LeadEnricher()
         print("✅ Python backend initialized successfully")
@@ -61,7 +98,8 @@ app = FastAPI(
     title="Fire Enrich Python Backend",
     description="Advanced multi-agent enrichment system using CrewAI",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware for Next.js frontend
@@ -74,35 +112,102 @@ app.add_middleware(
 )
 
 
-def convert_frontend_fields_to_enrichment_fields(fields: List[Dict[str, Any]]) -> List[EnrichmentField]:
-    """Convert frontend field format to EnrichmentField objects."""
+@lru_cache(maxsize=128)
+def _convert_fields_cached(fields_key: Tuple[Tuple[str, str, bool], ...]) -> Tuple[EnrichmentField, ...]:
+    """Classify a field schema, keyed on its (name, description, required) tuples."""
     enrichment_fields = []
     
-    for field in fields:
-        field_name = field.get('name', '').lower()
+    for name, description, required in fields_key:
+        field_name = name.lower()
         
         # Map field names to types based on content
-        if any(keyword in field_name for keyword in ['fund', 'invest', 'capital', 'series']):
-            field_type = FieldType.FUNDING
-        elif any(keyword in field_name for keyword in ['tech', 'stack', 'language', 'framework']):
-            field_type = FieldType.TECH_STACK
-        elif any(keyword in field_name for keyword in ['revenue', 'employee', 'size', 'metric']):
-            field_type = FieldType.METRICS
-        elif any(keyword in field_name for keyword in ['industry', 'headquarter', 'location']):
-            field_type = FieldType.COMPANY_PROFILE
-        else:
-            field_type = FieldType.GENERAL
+        field_type = next(
+            (ftype for pattern, ftype in FIELD_TYPE_CLASSIFIERS if pattern.search(field_name)),
+            FieldType.GENERAL
+        )
             
         enrichment_fields.append(
             EnrichmentField(
-                name=field.get('name', ''),
+                name=name,
                 type=field_type,
-                description=field.get('description', ''),
-                required=field.get('required', False)
+                description=description,
+                required=required
             )
         )
     
-    return enrichment_fields
+    return tuple(enrichment_fields)
+
+
+def convert_frontend_fields_to_enrichment_fields(fields: List[Dict[str, Any]]) -> List[EnrichmentField]:
+    """Convert frontend field format to EnrichmentField objects."""
+    # The frontend resends the same schema on every request, so classify each one once
+    fields_key = tuple(
+        (field.get('name', ''), field.get('description', ''), bool(field.get('required', False)))
+        for field in fields
+    )
+    return list(_convert_fields_cached(fields_key))
+
+
+def resolve_field_agents(fields: List[EnrichmentField]) -> Dict[str, Tuple[str, ...]]:
+    """Map each field name to the EnrichmentResult attributes that may carry it, highest precedence first."""
+    field_to_agents = {}
+    
+    for field in fields:
+        # The general agent's data is merged last, then later agents take precedence over earlier ones
+        agent_attrs = tuple(
+            attr for attr, model in reversed(AGENT_RESULT_MODELS.items()) if field.name in model.model_fields
+        )
+        field_to_agents[field.name] = ('general', *agent_attrs)
+    
+    return field_to_agents
+
+
+@lru_cache(maxsize=128)
+def compile_row_builder(field_agents: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> Callable[[EnrichmentResult], Dict[str, Any]]:
+    """
+    Generate a function that flattens an EnrichmentResult into a CSV row for one field schema.
+    
+    The generated code reads each field straight from its agent result, so the
+    per-row work is a fixed sequence of attribute loads with no loop over fields.
+    Each field is read from the general agent's data when it has the field,
+    otherwise from the highest-precedence declaring agent that ran, matching
+    the merge order of /enrich/single.
+    Field names only ever appear as repr() literals or as attribute names already
+    declared on the agent result models.
+    
+    Args:
+        field_agents: (field name, agent attributes) pairs from resolve_field_agents
+        
+    Returns:
+        build_row(result) returning the frontend row without its sources
+    """
+    used_agents = sorted({attr for _, attrs in field_agents for attr in attrs})
+    
+    lines = ["def build_row(result):"]
+    for attr in used_agents:
+        if attr == 'general':
+            lines.append("    general = result.general.extracted_data if result.general is not None else {}")
+        else:
+            lines.append(f"    {attr} = result.{attr}")
+    
+    lines.append("    return {")
+    lines.append("        'email': result.email,")
+    lines.append("        'domain': result.domain,")
+    for name, attrs in field_agents:
+        if attrs == ('general',):
+            lines.append(f"        {name!r}: general.get({name!r}),")
+        else:
+            value = " else ".join(
+                f"general[{name!r}] if {name!r} in general" if attr == 'general' else f"{attr}.{name} if {attr} is not None"
+                for attr in attrs
+            )
+            lines.append(f"        {name!r}: {value} else None,")
+    lines.append("        'confidence_score': result.overall_confidence,")
+    lines.append("    }")
+    
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["build_row"]
 
 
 @app.get("/health")
@@ -122,22 +227,27 @@ async def enrich_single_email(request: EnrichmentRequest) -> Dict[str, Any]:
     if not enricher:
         raise HTTPException(status_code=500, detail="Enricher not initialized")
     
+    if not EMAIL_RE.match(request.email):
+        raise HTTPException(status_code=400, detail=f"Invalid email address: {request.email}")
+    
     try:
         fields = convert_frontend_fields_to_enrichment_fields(request.fields)
-        result = enricher.enrich_email_sync(request.email, fields)
+        result = await enricher.enrich_email(request.email, fields)
+        
+        # Dump all agent results in one pass and flatten them in merge precedence order
+        agent_dumps = result.model_dump(include=set(AGENT_RESULT_ATTRS))
+        data = {}
+        for attr in AGENT_RESULT_MODELS:
+            if agent_dumps[attr]:
+                data.update(agent_dumps[attr])
+        if agent_dumps['general']:
+            data.update(agent_dumps['general']['extracted_data'])
         
         # Convert to frontend-compatible format
         return {
             "email": result.email,
             "domain": result.domain,
-            "data": {
-                **(result.discovery.dict() if result.discovery else {}),
-                **(result.company_profile.dict() if result.company_profile else {}),
-                **(result.funding.dict() if result.funding else {}),
-                **(result.tech_stack.dict() if result.tech_stack else {}),
-                **(result.metrics.dict() if result.metrics else {}),
-                **(result.general.extracted_data if result.general else {}),
-            },
+            "data": data,
             "confidence_score": result.overall_confidence,
             "processing_time": result.processing_time,
             "errors": result.errors
@@ -157,73 +267,104 @@ async def enrich_csv_data(request: CSVEnrichmentRequest, background_tasks: Backg
         """Generate SSE stream for CSV enrichment."""
         try:
             fields = convert_frontend_fields_to_enrichment_fields(request.fields)
+            field_to_agents = resolve_field_agents(fields)
+            build_row = compile_row_builder(tuple(field_to_agents.items()))
             total_rows = len(request.csv_data)
             
             # Send initial status
-            yield f"data: {json.dumps({'type': 'status', 'status': 'starting', 'total_rows': total_rows})}\n\n"
+            yield sse({'type': 'status', 'status': 'starting', 'total_rows': total_rows})
             
-            for i, row in enumerate(request.csv_data):
-                email = row.get(request.email_column)
-                if not email:
-                    continue
-                
+            semaphore = asyncio.Semaphore(CSV_CONCURRENCY)
+            
+            async def process_domain(rows: List[Tuple[int, str]]) -> List[Dict[str, Any]]:
+                """Enrich one domain once, bounded by the shared semaphore, and fan it out to its rows."""
+                email = rows[0][1]
                 try:
-                    # Send progress update
-                    yield f"data: {json.dumps({'type': 'progress', 'current_row': i + 1, 'total_rows': total_rows})}\n\n"
-                    
-                    if request.enhanced_mode:
-                        # Use enhanced CSV processing for lead data
-                        # This would require implementing a streaming version of process_lead_csv
-                        result = enricher.enrich_email_sync(email, fields)
-                    else:
-                        # Use basic enrichment
-                        result = enricher.enrich_email_sync(email, fields)
+                    async with semaphore:
+                        if request.enhanced_mode:
+                            # Use enhanced CSV processing for lead data
+                            # This would require implementing a streaming version of process_lead_csv
+                            result = await enricher.enrich_email(email, fields)
+                        else:
+                            # Use basic enrichment
+                            result = await enricher.enrich_email(email, fields)
                     
                     # Convert result to frontend format
-                    enriched_data = {
-                        "email": result.email,
-                        "domain": result.domain,
-                        **{field.name: getattr(result.discovery, field.name, None) if result.discovery else None for field in fields if result.discovery},
-                        **{field.name: getattr(result.company_profile, field.name, None) if result.company_profile else None for field in fields if result.company_profile},
-                        **{field.name: getattr(result.funding, field.name, None) if result.funding else None for field in fields if result.funding},
-                        **{field.name: getattr(result.tech_stack, field.name, None) if result.tech_stack else None for field in fields if result.tech_stack},
-                        **{field.name: getattr(result.metrics, field.name, None) if result.metrics else None for field in fields if result.metrics},
-                        **{field.name: result.general.extracted_data.get(field.name) if result.general else None for field in fields},
-                        "confidence_score": result.overall_confidence,
-                        "sources": []  # Combine all source URLs
-                    }
+                    enriched_data = build_row(result)
                     
-                    # Add all source URLs
-                    all_sources = []
-                    for agent_result in [result.discovery, result.company_profile, result.funding, result.tech_stack, result.metrics, result.general]:
-                        if agent_result and hasattr(agent_result, 'source_urls'):
-                            all_sources.extend(agent_result.source_urls)
-                    enriched_data["sources"] = list(set(all_sources))
+                    # Combine all source URLs
+                    sources = set()
+                    for attr in AGENT_RESULT_ATTRS:
+                        agent_result = getattr(result, attr)
+                        if agent_result:
+                            sources.update(agent_result.source_urls)
+                    enriched_data["sources"] = list(sources)
                     
-                    # Send enriched row result
-                    yield f"data: {json.dumps({'type': 'result', 'row_index': i, 'data': enriched_data})}\n\n"
+                    return [
+                        {'type': 'result', 'row_index': i, 'data': {**enriched_data, "email": row_email}}
+                        for i, row_email in rows
+                    ]
                     
                 except Exception as e:
-                    # Send error for this row
-                    yield f"data: {json.dumps({'type': 'error', 'row_index': i, 'error': str(e)})}\n\n"
+                    # Report error for every row on this domain
+                    return [{'type': 'error', 'row_index': i, 'error': str(e)} for i, _ in rows]
+            
+            # Group rows by domain so contacts at the same company share one enrichment
+            domain_to_rows: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
+            immediate = []
+            for i, row in enumerate(request.csv_data):
+                email = row.get(request.email_column)
+                if not email:
+                    continue
+                if not EMAIL_RE.match(str(email)):
+                    # Reject malformed addresses without scheduling any work
+                    immediate.append({'type': 'error', 'row_index': i, 'error': f"Invalid email address: {email}"})
+                    continue
                 
-                # Small delay to prevent overwhelming
-                await asyncio.sleep(0.1)
+                domain = email[email.rfind('@') + 1:].lower()
+                if domain in PUBLIC_EMAIL_DOMAINS:
+                    # Personal email providers have no company to enrich
+                    skipped = {"email": email, "domain": domain, **dict.fromkeys(field_to_agents), "confidence_score": 0.0, "sources": []}
+                    immediate.append({'type': 'result', 'row_index': i, 'data': skipped})
+                    continue
+                domain_to_rows[domain].append((i, email))
+            
+            tasks = [asyncio.create_task(process_domain(rows)) for rows in domain_to_rows.values()]
+            
+            async def completed_events():
+                """Yield rejected and skipped rows first, then each domain's rows as it finishes enriching."""
+                for event in immediate:
+                    yield event
+                for next_done in asyncio.as_completed(tasks):
+                    for event in await next_done:
+                        yield event
+            
+            try:
+                # Rows finish out of order; row_index identifies each result
+                completed = 0
+                async for event in completed_events():
+                    completed += 1
+                    
+                    # Send progress update
+                    yield sse({'type': 'progress', 'current_row': completed, 'total_rows': total_rows, 'row_index': event['row_index']})
+                    
+                    # Send enriched row result (or row error)
+                    yield sse(event)
+            finally:
+                # Client disconnected or stream failed: stop outstanding rows
+                for task in tasks:
+                    task.cancel()
             
             # Send completion
-            yield f"data: {json.dumps({'type': 'complete'})}\n\n"
+            yield sse({'type': 'complete'})
             
         except Exception as e:
-            yield f"data: {json.dumps({'type': 'error', 'error': str(e)})}\n\n"
+            yield sse({'type': 'error', 'error': str(e)})
     
     return StreamingResponse(
         generate_enrichment_stream(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "Access-Control-Allow-Origin": "*",
-        }
+        media_type=SSE_MEDIA_TYPE,
+        headers=SSE_HEADERS
     )
 
 
@@ -234,7 +375,7 @@ async def enrich_leads_csv(csv_file_path: str, output_path: str):
         raise HTTPException(status_code=500, detail="Enricher not initialized")
     
     try:
-        result = enricher.process_lead_csv(csv_file_path, output_path)
+        result = await enricher.process_lead_csv_async(csv_file_path, output_path)
         return {
             "success": True,
             "output_path": output_path,
@@ -249,6 +390,40 @@ async def enrich_leads_csv(csv_file_path: str, output_path: str):
         raise HTTPException(status_code=500, detail=f"Lead processing failed: {str(e)}")
 
 
+
+@app.post("/enrich/leads/stream")
+async def stream_leads_csv(csv_file_path: str):
+    """Process lead CSV in enhanced mode, streaming the enriched CSV back as it is produced."""
+    if not enricher:
+        raise HTTPException(status_code=500, detail="Enricher not initialized")
+    if not os.path.exists(csv_file_path):
+        raise HTTPException(status_code=404, detail=f"CSV file not found: {csv_file_path}")
+    
+    def generate_csv():
+        """Generate CSV text one row at a time; runs in Starlette's threadpool."""
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, **LEAD_CSV_WRITE_OPTIONS)
+        writer.writeheader()
+        
+        # Send the header on its own, so input with no qualifying rows still gets one
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        
+        for row in enricher.iter_lead_csv(csv_file_path):
+            writer.writerow(row)
+            
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+    
+    return StreamingResponse(
+        generate_csv(),
+        media_type="text/csv",
+        headers={"Content-Disposition": "attachment; filename=enriched.csv"}
+    )
+
+
 if __name__ == "__main__":
     uvicorn.run(
         "src.api_server:app",
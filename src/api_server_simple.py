@@ -5,24 +5,75 @@ This version provides the basic integration without the full CrewAI multiagent s
 """
 
 import asyncio
-import json
+import copy
+import hashlib
 import os
 from contextlib import asynccontextmanager
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, NamedTuple, Optional
 
+import httpx
 import uvicorn
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 import openai
+import orjson
+from aiolimiter import AsyncLimiter
+from cachetools import TTLCache
 from dotenv import load_dotenv
 
+from .public_email_domains import EMAIL_RE, PUBLIC_EMAIL_DOMAINS
+from .responses import ORJSONResponse, SSE_HEADERS, SSE_MEDIA_TYPE, sse
+
 load_dotenv()
 
+# Maximum number of CSV requests to OpenAI in flight, and unique domains per request
+CSV_CONCURRENCY = 8
+CSV_BATCH_SIZE = 10
+
+SYSTEM_PROMPT = "You are a business intelligence assistant that extracts company information. Always respond with valid JSON."
+SYSTEM_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT}
+
+# Prompt bodies up to the domain(s), rendered once per field schema by prepare_fields
+PROMPT_TEMPLATE = """
+        Please provide the following information if available:
+{fields}
+        
+        Return the response as a JSON object with the field names as keys.
+        If information is not available, use null for that field.
+        Include a confidence_score (0-1) for each field.
+        
+        Extract information about the company with domain: """
+
+BATCH_PROMPT_TEMPLATE = """
+        Please provide the following information for each company if available:
+{fields}
+        
+        Return the response as a JSON object keyed by domain, where each value is
+        a JSON object with the field names as keys.
+        If information is not available, use null for that field.
+        Include a confidence_score (0-1) for each field.
+        
+        Extract information about the companies with the following domains:
+"""
+
+# Shared HTTP/2 connection pool for OpenAI calls
+HTTP_MAX_CONNECTIONS = 32
+HTTP_TIMEOUT_SECONDS = 30.0
+
+# OpenAI request budget; raise it to match the account's rate limit tier
+OPENAI_REQUESTS_PER_MINUTE = int(os.getenv("OPENAI_REQUESTS_PER_MINUTE", "60"))
+
+# Domain-level enrichment cache settings
+CACHE_MAXSIZE = 10_000
+CACHE_TTL_SECONDS = 86400
+
+
 class EnrichmentRequest(BaseModel):
     email: str
     fields: List[Dict[str, Any]]
+    stream: bool = False  # Stream OpenAI tokens as SSE instead of returning JSON
 
 
 class CSVEnrichmentRequest(BaseModel):
@@ -32,6 +83,13 @@ class CSVEnrichmentRequest(BaseModel):
     enhanced_mode: bool = False
 
 
+class FieldSchema(NamedTuple):
+    """Per-request values derived from the frontend field definitions."""
+    fields_hash: str
+    prompt_prefix: str
+    batch_prompt_prefix: str
+
+
 class SimpleEnricher:
     """Simplified enricher without CrewAI dependencies."""
     
@@ -44,74 +102,280 @@ class SimpleEnricher:
         if not self.firecrawl_api_key:
             raise ValueError("FIRECRAWL_API_KEY environment variable is required")
         
+        # One keep-alive HTTP/2 client so concurrent rows multiplex over shared connections
+        self._http = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_CONNECTIONS
+            ),
+            timeout=HTTP_TIMEOUT_SECONDS
+        )
+        
         try:
-            self.openai_client = openai.OpenAI(api_key=self.openai_api_key)
+            self.openai_client = openai.AsyncOpenAI(api_key=self.openai_api_key, http_client=self._http)
         except TypeError:
             # Fallback for older OpenAI versions
-            self.openai_client = openai.OpenAI(
+            self.openai_client = openai.AsyncOpenAI(
                 api_key=self.openai_api_key,
-                timeout=30.0
+                timeout=HTTP_TIMEOUT_SECONDS,
+                http_client=self._http
             )
+        
+        # Token bucket shared by every OpenAI call, so bursts only wait when over quota
+        self._limiter = AsyncLimiter(OPENAI_REQUESTS_PER_MINUTE, time_period=60)
+        
+        # Enrichment results keyed on (domain, fields hash)
+        self._cache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL_SECONDS)
+        self._cache_lock = asyncio.Lock()
     
-    def enrich_email_simple(self, email: str, fields: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Simple email enrichment using OpenAI directly."""
-        domain = email.split('@')[1].lower()
+    @staticmethod
+    def _extract_domain(email: str) -> str:
+        """Validate an email address and return its lowercased domain."""
+        if not EMAIL_RE.match(email):
+            raise ValueError(f"Invalid email address: {email}")
+        return email[email.rfind('@') + 1:].lower()
+    
+    async def aclose(self):
+        """Close the shared HTTP client."""
+        await self._http.aclose()
+    
+    async def _get_cached(self, email: str, cache_key: tuple) -> Optional[Dict[str, Any]]:
+        """Return a cached enrichment for another row on the same domain, if any."""
+        async with self._cache_lock:
+            cached = self._cache.get(cache_key)
+        if cached is None:
+            return None
+        result = copy.deepcopy(cached)
+        result["email"] = email
+        return result
+    
+    def prepare_fields(self, fields: List[Dict[str, Any]]) -> FieldSchema:
+        """
+        Precompute the per-schema parts of every request for these fields.
+        
+        Build this once per incoming request and pass it to the enrich methods
+        so rows do not each re-hash the schema or re-render the prompt.
+        """
+        fields_hash = hashlib.blake2b(
+            orjson.dumps(fields, option=orjson.OPT_SORT_KEYS), digest_size=16
+        ).hexdigest()
         
         # Create field descriptions
-        field_descriptions = []
-        for field in fields:
-            field_descriptions.append(f"- {field.get('name', '')}: {field.get('description', '')}")
+        field_descriptions = chr(10).join(
+            f"        - {field.get('name', '')}: {field.get('description', '')}" for field in fields
+        )
         
-        prompt = f"""
-        Extract information about the company with domain: {domain}
+        return FieldSchema(
+            fields_hash=fields_hash,
+            prompt_prefix=PROMPT_TEMPLATE.format(fields=field_descriptions),
+            batch_prompt_prefix=BATCH_PROMPT_TEMPLATE.format(fields=field_descriptions)
+        )
+    
+    def _build_messages(self, domain: str, schema: FieldSchema) -> List[Dict[str, str]]:
+        """Build the chat messages asking OpenAI to enrich a domain."""
+        return [
+            SYSTEM_MESSAGE,
+            {"role": "user", "content": schema.prompt_prefix + domain}
+        ]
+    
+    def _build_batch_messages(self, domains: List[str], schema: FieldSchema) -> List[Dict[str, str]]:
+        """Build the chat messages asking OpenAI to enrich several domains at once."""
+        return [
+            SYSTEM_MESSAGE,
+            {"role": "user", "content": schema.batch_prompt_prefix + chr(10).join(f"        - {domain}" for domain in domains)}
+        ]
+    
+    def _parse_result_data(self, result_text: Optional[str]) -> Dict[str, Any]:
+        """Parse the JSON object returned by OpenAI, raising ValueError for anything else."""
+        try:
+            result_data = orjson.loads(result_text)
+        except (orjson.JSONDecodeError, TypeError):
+            result_data = None
         
-        Please provide the following information if available:
-        {chr(10).join(field_descriptions)}
+        if not isinstance(result_data, dict):
+            raise ValueError("OpenAI response was not a JSON object")
+        return result_data
+    
+    async def _build_result(self, email: str, domain: str, result_data: Dict[str, Any], cache_key: tuple) -> Dict[str, Any]:
+        """Wrap extracted data into a result and cache it."""
+        result = {
+            "email": email,
+            "domain": domain,
+            "data": result_data,
+            "confidence_score": 0.7,  # Default confidence
+            "processing_time": 2.0,   # Placeholder
+            "errors": [],
+            "source": "simple_openai_enrichment"
+        }
+        async with self._cache_lock:
+            self._cache[cache_key] = result
+        return copy.deepcopy(result)
+    
+    def _skipped_result(self, email: str, domain: str, fields: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the result for personal email providers, where company data does not apply."""
+        return {
+            "email": email,
+            "domain": domain,
+            "data": {field.get('name', f'field_{i}'): None for i, field in enumerate(fields)},
+            "confidence_score": 0.0,
+            "processing_time": 0.0,
+            "errors": [],
+            "source": "public_email_skipped"
+        }
+    
+    def _error_result(self, email: str, domain: str, fields: List[Dict[str, Any]], error: Exception) -> Dict[str, Any]:
+        """Build the result returned when enrichment fails."""
+        return {
+            "email": email,
+            "domain": domain,
+            "data": {field.get('name', f'field_{i}'): None for i, field in enumerate(fields)},
+            "confidence_score": 0.0,
+            "processing_time": 0.0,
+            "errors": [str(error)],
+            "source": "error"
+        }
+    
+    async def enrich_email_simple(self, email: str, fields: List[Dict[str, Any]], schema: Optional[FieldSchema] = None) -> Dict[str, Any]:
+        """Simple email enrichment using OpenAI directly."""
+        domain = self._extract_domain(email)
+        if domain in PUBLIC_EMAIL_DOMAINS:
+            return self._skipped_result(email, domain, fields)
         
-        Return the response as a JSON object with the field names as keys.
-        If information is not available, use null for that field.
-        Include a confidence_score (0-1) for each field.
+        # Rows sharing a domain and field schema reuse the same enrichment
+        schema = schema or self.prepare_fields(fields)
+        cache_key = (domain, schema.fields_hash)
+        cached = await self._get_cached(email, cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            async with self._limiter:
+                response = await self.openai_client.chat.completions.create(
+                    model="gpt-4",
+                    messages=self._build_messages(domain, schema),
+                    temperature=0.1
+                )
+            
+            result_data = self._parse_result_data(response.choices[0].message.content)
+            return await self._build_result(email, domain, result_data, cache_key)
+            
+        except Exception as e:
+            return self._error_result(email, domain, fields, e)
+    
+    async def enrich_email_stream(self, email: str, fields: List[Dict[str, Any]], schema: Optional[FieldSchema] = None) -> AsyncIterator[Dict[str, Any]]:
         """
+        Streaming version of enrich_email_simple.
+        
+        Yields {"type": "token", "token": ...} events as OpenAI produces the
+        response, followed by a single {"type": "result", "data": ...} event
+        holding the same result enrich_email_simple would return.
+        """
+        domain = self._extract_domain(email)
+        if domain in PUBLIC_EMAIL_DOMAINS:
+            yield {"type": "result", "data": self._skipped_result(email, domain, fields)}
+            return
+        
+        schema = schema or self.prepare_fields(fields)
+        cache_key = (domain, schema.fields_hash)
+        cached = await self._get_cached(email, cache_key)
+        if cached is not None:
+            yield {"type": "result", "data": cached}
+            return
         
         try:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a business intelligence assistant that extracts company information. Always respond with valid JSON."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1
-            )
+            async with self._limiter:
+                stream = await self.openai_client.chat.completions.create(
+                    model="gpt-4",
+                    messages=self._build_messages(domain, schema),
+                    temperature=0.1,
+                    stream=True
+                )
             
-            result_text = response.choices[0].message.content
+            chunks = []
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    chunks.append(delta)
+                    yield {"type": "token", "token": delta}
             
-            # Try to parse JSON response
-            try:
-                result_data = json.loads(result_text)
-            except json.JSONDecodeError:
-                # Fallback if JSON parsing fails
-                result_data = {field.get('name', f'field_{i}'): None for i, field in enumerate(fields)}
-            
-            return {
-                "email": email,
-                "domain": domain,
-                "data": result_data,
-                "confidence_score": 0.7,  # Default confidence
-                "processing_time": 2.0,   # Placeholder
-                "errors": [],
-                "source": "simple_openai_enrichment"
-            }
+            result_data = self._parse_result_data("".join(chunks))
+            result = await self._build_result(email, domain, result_data, cache_key)
+            
+        except Exception as e:
+            result = self._error_result(email, domain, fields, e)
+        
+        yield {"type": "result", "data": result}
+    
+    async def enrich_emails_batch(self, emails: List[str], fields: List[Dict[str, Any]], schema: Optional[FieldSchema] = None) -> List[Dict[str, Any]]:
+        """
+        Enrich several emails with a single OpenAI request.
+        
+        Cached domains are served from the cache and repeated domains are asked
+        about once, so the prompt only lists each outstanding domain one time.
+        
+        Args:
+            emails: Email addresses to enrich
+            fields: Frontend field definitions to extract
+            schema: Result of prepare_fields(fields), built here if omitted
+            
+        Returns:
+            One result per email, in input order, shaped like enrich_email_simple's
+        """
+        schema = schema or self.prepare_fields(fields)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(emails)
+        pending: Dict[str, List[int]] = {}
+        
+        for idx, email in enumerate(emails):
+            domain = self._extract_domain(email)
+            if domain in PUBLIC_EMAIL_DOMAINS:
+                results[idx] = self._skipped_result(email, domain, fields)
+                continue
+            
+            cached = await self._get_cached(email, (domain, schema.fields_hash))
+            if cached is not None:
+                results[idx] = cached
+            else:
+                pending.setdefault(domain, []).append(idx)
+        
+        if not pending:
+            return results
+        
+        try:
+            async with self._limiter:
+                response = await self.openai_client.chat.completions.create(
+                    model="gpt-4",
+                    messages=self._build_batch_messages(list(pending), schema),
+                    temperature=0.1
+                )
+            batch_data = orjson.loads(response.choices[0].message.content)
+            if not isinstance(batch_data, dict):
+                raise ValueError("Batch response was not a JSON object keyed by domain")
+            # Domains were sent lowercased, but the model does not always echo them that way
+            batch_data = {key.strip().lower(): value for key, value in batch_data.items()}
             
         except Exception as e:
-            return {
-                "email": email,
-                "domain": domain,
-                "data": {field.get('name', f'field_{i}'): None for i, field in enumerate(fields)},
-                "confidence_score": 0.0,
-                "processing_time": 0.0,
-                "errors": [str(e)],
-                "source": "error"
-            }
+            for domain, indices in pending.items():
+                for idx in indices:
+                    results[idx] = self._error_result(emails[idx], domain, fields, e)
+            return results
+        
+        for domain, indices in pending.items():
+            result_data = batch_data.get(domain)
+            if not isinstance(result_data, dict):
+                # Left uncached, so a later request can try this domain again
+                error = ValueError(f"Batch response had no JSON object for {domain}")
+                for idx in indices:
+                    results[idx] = self._error_result(emails[idx], domain, fields, error)
+                continue
+            
+            result = await self._build_result(emails[indices[0]], domain, result_data, (domain, schema.fields_hash))
+            for idx in indices:
+                results[idx] = {**copy.deepcopy(result), "email": emails[idx]}
+        
+        return results
 
 
 # Global enricher instance
@@ -120,7 +384,7 @@ enricher: Optional[SimpleEnricher] = None
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize the enricher on startup."""
+    """Initialize the enricher on startup and release its connections on shutdown."""
     global enricher
     try:
         enricher = SimpleEnricher()
@@ -129,13 +393,15 @@ async def lifespan(app: FastAPI):
         print(f"❌ Failed to initialize Python backend: {e}")
         raise
     yield
+    await enricher.aclose()
 
 
 app = FastAPI(
     title="Fire Enrich Simple Python Backend",
     description="Simplified enrichment system without CrewAI dependencies",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware for Next.js frontend
@@ -166,8 +432,26 @@ async def enrich_single_email(request: EnrichmentRequest) -> Dict[str, Any]:
     if not enricher:
         raise HTTPException(status_code=500, detail="Enricher not initialized")
     
+    if not EMAIL_RE.match(request.email):
+        raise HTTPException(status_code=400, detail=f"Invalid email address: {request.email}")
+    
+    if request.stream:
+        async def generate_token_stream():
+            """Generate SSE stream of OpenAI tokens followed by the result."""
+            try:
+                async for event in enricher.enrich_email_stream(request.email, request.fields):
+                    yield sse(event)
+            except Exception as e:
+                yield sse({'type': 'error', 'error': str(e)})
+        
+        return StreamingResponse(
+            generate_token_stream(),
+            media_type=SSE_MEDIA_TYPE,
+            headers=SSE_HEADERS
+        )
+    
     try:
-        result = enricher.enrich_email_simple(request.email, request.fields)
+        result = await enricher.enrich_email_simple(request.email, request.fields)
         return result
         
     except Exception as e:
@@ -186,53 +470,95 @@ async def enrich_csv_data(request: CSVEnrichmentRequest, background_tasks: Backg
             total_rows = len(request.csv_data)
             
             # Send initial status
-            yield f"data: {json.dumps({'type': 'status', 'status': 'starting', 'total_rows': total_rows})}\n\n"
+            yield sse({'type': 'status', 'status': 'starting', 'total_rows': total_rows})
+            
+            semaphore = asyncio.Semaphore(CSV_CONCURRENCY)
+            events: asyncio.Queue = asyncio.Queue()
+            
+            # Hash the field schema and render the prompt once for every batch
+            schema = enricher.prepare_fields(request.fields)
             
+            def to_frontend_row(result: Dict[str, Any]) -> Dict[str, Any]:
+                """Convert an enrichment result to frontend format."""
+                return {
+                    "email": result["email"],
+                    "domain": result["domain"],
+                    **result["data"],
+                    "confidence_score": result["confidence_score"],
+                    "sources": [] if result["source"] == "public_email_skipped" else ["Simple OpenAI enrichment"]
+                }
+            
+            async def process_batch(rows: List[tuple]):
+                """Enrich a batch of rows with one OpenAI request, queueing each row's result."""
+                try:
+                    async with semaphore:
+                        results = await enricher.enrich_emails_batch([email for _, email in rows], request.fields, schema)
+                except Exception as e:
+                    # Report error for every row in the batch
+                    for i, _ in rows:
+                        await events.put({'type': 'error', 'row_index': i, 'error': str(e)})
+                    return
+                
+                for (i, _), result in zip(rows, results):
+                    await events.put({'type': 'result', 'row_index': i, 'data': to_frontend_row(result)})
+            
+            # Group rows by domain so each domain is asked about once
+            domain_groups: Dict[str, List[tuple]] = {}
+            pending_rows = 0
             for i, row in enumerate(request.csv_data):
                 email = row.get(request.email_column)
                 if not email:
                     continue
+                pending_rows += 1
                 
                 try:
-                    # Send progress update
-                    yield f"data: {json.dumps({'type': 'progress', 'current_row': i + 1, 'total_rows': total_rows})}\n\n"
-                    
-                    # Process this row
-                    result = enricher.enrich_email_simple(email, request.fields)
-                    
-                    # Convert result to frontend format
-                    enriched_data = {
-                        "email": result["email"],
-                        "domain": result["domain"],
-                        **result["data"],
-                        "confidence_score": result["confidence_score"],
-                        "sources": ["Simple OpenAI enrichment"]
-                    }
+                    domain = SimpleEnricher._extract_domain(str(email))
+                except ValueError as e:
+                    # Reject malformed addresses without scheduling any work
+                    events.put_nowait({'type': 'error', 'row_index': i, 'error': str(e)})
+                    continue
+                
+                if domain in PUBLIC_EMAIL_DOMAINS:
+                    # Personal email providers have no company to enrich
+                    skipped = enricher._skipped_result(email, domain, request.fields)
+                    events.put_nowait({'type': 'result', 'row_index': i, 'data': to_frontend_row(skipped)})
+                    continue
+                domain_groups.setdefault(domain, []).append((i, email))
+            
+            # Pack up to CSV_BATCH_SIZE unique domains (with all their rows) into each request
+            groups = list(domain_groups.values())
+            tasks = [
+                asyncio.create_task(process_batch([row for group in groups[start:start + CSV_BATCH_SIZE] for row in group]))
+                for start in range(0, len(groups), CSV_BATCH_SIZE)
+            ]
+            
+            try:
+                # Rows finish out of order; row_index identifies each event
+                completed = 0
+                while completed < pending_rows:
+                    event = await events.get()
+                    completed += 1
                     
-                    # Send enriched row result
-                    yield f"data: {json.dumps({'type': 'result', 'row_index': i, 'data': enriched_data})}\n\n"
+                    # Send progress update
+                    yield sse({'type': 'progress', 'current_row': completed, 'total_rows': total_rows, 'row_index': event['row_index']})
                     
-                except Exception as e:
-                    # Send error for this row
-                    yield f"data: {json.dumps({'type': 'error', 'row_index': i, 'error': str(e)})}\n\n"
-                
-                # Small delay to prevent overwhelming
-                await asyncio.sleep(0.5)
+                    # Send enriched row result (or row error)
+                    yield sse(event)
+            finally:
+                # Client disconnected or stream failed: stop outstanding rows
+                for task in tasks:
+                    task.cancel()
             
             # Send completion
-            yield f"data: {json.dumps({'type': 'complete'})}\n\n"
+            yield sse({'type': 'complete'})
             
         except Exception as e:
-            yield f"data: {json.dumps({'type': 'error', 'error': str(e)})}\n\n"
+            yield sse({'type': 'error', 'error': str(e)})
     
     return StreamingResponse(
         generate_enrichment_stream(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "Access-Control-Allow-Origin": "*",
-        }
+        media_type=SSE_MEDIA_TYPE,
+        headers=SSE_HEADERS
     )
 
 
@@ -1,34 +1,170 @@
+import asyncio
+import concurrent.futures
+import csv
+import importlib
+import logging
 import os
+import sys
+import threading
 import time
-from typing import List, Optional
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, FrozenSet, Iterator, List, Optional, Tuple
+from cachetools import TTLCache
 from dotenv import load_dotenv
-from crewai import Crew, Process
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
 
+from .agents import VERBOSE
+from .public_email_domains import EMAIL_RE
 from .models.schemas import (
     EmailContext, EnrichmentField, EnrichmentResult, FieldType,
     DiscoveryResult, CompanyProfileResult, FundingResult, 
     TechStackResult, MetricsResult, GeneralResult,
     LeadCSVRow, DecisionMakerValidation, EmailResearchResult, LeadProcessingResult
 )
-from .agents.discovery_agent import create_discovery_agent
-from .agents.company_profile_agent import create_company_profile_agent
-from .agents.funding_agent import create_funding_agent
-from .agents.tech_stack_agent import create_tech_stack_agent
-from .agents.metrics_agent import create_metrics_agent
-from .agents.general_agent import create_general_agent
-from .agents.email_research_agent import create_email_research_agent
-from .agents.company_description_agent import create_company_description_agent
-from .agents.decision_maker_agent import create_decision_maker_agent
-from .tasks.enrichment_tasks import (
-    create_discovery_task, create_company_profile_task, create_funding_task,
-    create_tech_stack_task, create_metrics_task, create_general_task
+
+try:
+    import uvloop
+    _LOOP_FACTORY = uvloop.new_event_loop
+except ImportError:
+    # uvloop is not available on Windows; fall back to the default asyncio loop
+    _LOOP_FACTORY = None
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Counters reported in LeadProcessingResult
+LEAD_STAT_KEYS = ("decision_makers_found", "emails_researched", "company_descriptions_created", "sunbiz_lookups")
+
+# Validation attached to every researched stand-in decision maker; identical for all companies
+RESEARCHED_DECISION_MAKER_VALIDATION = DecisionMakerValidation(
+    is_decision_maker=True,
+    confidence_score=0.7,
+    reasoning="Researched decision maker for company",
+    seniority_level="researched",
+    job_title="Decision Maker"
 )
-from .tasks.lead_enrichment_tasks import (
-    create_email_research_task, create_company_description_task, create_decision_maker_validation_task
+
+# Read every lead column as text with blanks as "", so phone numbers and ZIP-like
+# values are not parsed as floats and empty cells never become NaN
+LEAD_CSV_READ_OPTIONS = {"dtype": str, "keep_default_na": False}
+
+# Column order of the enriched lead CSV, matching _lead_row_to_dict
+LEAD_OUTPUT_COLUMNS = (
+    "organization_name", "First_Name", "Last_Name", "Seniority_Title", "Email", "Personal_Email_1",
+    "Company_Description", "Linkedin_Url", "Organization_Linkedin_Url", "Org_Website_Url", "Org_Phone",
+    "Is_Decision_Maker", "Sunbiz_Data"
 )
-from .tools.sunbiz_scraper import SunbizScraperTool
 
-load_dotenv()
+# DictWriter settings for enriched lead CSVs; plain \n line endings match the original pandas output
+LEAD_CSV_WRITE_OPTIONS = {"fieldnames": LEAD_OUTPUT_COLUMNS, "lineterminator": "\n"}
+
+# Output columns copied as-is from LeadCSVRow attributes; Seniority_Title and Sunbiz_Data are derived
+LEAD_COLUMN_ATTRS = {
+    "organization_name": "organization_name",
+    "First_Name": "first_name",
+    "Last_Name": "last_name",
+    "Email": "email",
+    "Personal_Email_1": "personal_email_1",
+    "Company_Description": "company_description",
+    "Linkedin_Url": "linkedin_url",
+    "Organization_Linkedin_Url": "organization_linkedin_url",
+    "Org_Website_Url": "org_website_url",
+    "Org_Phone": "org_phone",
+    "Is_Decision_Maker": "is_decision_maker",
+}
+_get_lead_column_values = attrgetter(*LEAD_COLUMN_ATTRS.values())
+
+# Maximum number of companies researched at once by process_lead_csv_async
+LEAD_CSV_CONCURRENCY = 8
+
+# Per-agent crew results reused across emails on the same domain
+CREW_CACHE_MAXSIZE = 1_000
+CREW_CACHE_TTL_SECONDS = 7 * 86400
+
+# Worker threads for blocking enrichment calls run off the event loop, including crew kickoffs
+THREADPOOL_SIZE = 64
+
+# Agent factories by result key; imported on first use so CrewAI and the
+# Firecrawl tools are not loaded until an enrichment actually needs them
+_AGENT_FACTORIES = {
+    'discovery': ('.agents.discovery_agent', 'create_discovery_agent'),
+    'company_profile': ('.agents.company_profile_agent', 'create_company_profile_agent'),
+    'funding': ('.agents.funding_agent', 'create_funding_agent'),
+    'tech_stack': ('.agents.tech_stack_agent', 'create_tech_stack_agent'),
+    'metrics': ('.agents.metrics_agent', 'create_metrics_agent'),
+    'general': ('.agents.general_agent', 'create_general_agent'),
+}
+
+@lru_cache(maxsize=None)
+def _get_agent_factory(agent_key: str) -> Callable:
+    """Import and return the agent factory registered for agent_key."""
+    module_name, factory_name = _AGENT_FACTORIES[agent_key]
+    return getattr(importlib.import_module(module_name, __package__), factory_name)
+
+@lru_cache(maxsize=None)
+def _get_task_factory(agent_key: str) -> Callable:
+    """Import and return the task factory for agent_key's agent."""
+    return getattr(importlib.import_module('.tasks.enrichment_tasks', __package__), f'create_{agent_key}_task')
+
+
+
+def _is_transient_error(exc: BaseException) -> bool:
+    """Whether a crew failure is a rate limit, timeout or connection error worth retrying."""
+    transient = [TimeoutError]
+    
+    # An error can only come from a client that has been imported, so look the
+    # modules up rather than importing them. CrewAI calls OpenAI through
+    # LiteLLM, whose exceptions subclass the OpenAI ones.
+    openai = sys.modules.get("openai")
+    if openai:
+        transient += [openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError]
+    httpx = sys.modules.get("httpx")
+    if httpx:
+        transient.append(httpx.TransportError)
+    
+    return isinstance(exc, tuple(transient))
+
+
+@retry(
+    retry=retry_if_exception(_is_transient_error),
+    wait=wait_random_exponential(multiplier=1, max=30),
+    stop=stop_after_attempt(4),
+    reraise=True
+)
+async def _kickoff_with_retry(crew):
+    """Kick off a crew in a worker thread, retrying transient failures with jittered backoff."""
+    return await asyncio.to_thread(crew.kickoff)
+
+
+class ContextBuilder:
+    """Accumulates context lines from earlier agents for the prompts of later ones."""
+    
+    def __init__(self):
+        self._parts = []
+    
+    def add_discovery(self, discovery: DiscoveryResult):
+        """Append the company name, website and description found by discovery."""
+        self._parts.append(f"Company: {discovery.company_name}")
+        if discovery.website:
+            self._parts.append(f"Website: {discovery.website}")
+        if discovery.description:
+            self._parts.append(f"Description: {discovery.description}")
+    
+    def add_company_profile(self, profile: CompanyProfileResult):
+        """Append the industry and size found by the company profile agent."""
+        if profile.industry:
+            self._parts.append(f"Industry: {profile.industry}")
+        if profile.company_size:
+            self._parts.append(f"Size: {profile.company_size}")
+    
+    def render(self) -> str:
+        """Return the context string passed to agent tasks."""
+        return "\n".join(self._parts)
+
 
 class LeadEnricher:
     """Main class for enriching email data using CrewAI multiagent framework."""
@@ -42,52 +178,104 @@ class LeadEnricher:
             raise ValueError("OPENAI_API_KEY environment variable is required")
         if not self.firecrawl_api_key:
             raise ValueError("FIRECRAWL_API_KEY environment variable is required")
+        
+        # Crews may run from several threads and event loops, so guard the cache with a thread lock
+        self._crew_cache = TTLCache(maxsize=CREW_CACHE_MAXSIZE, ttl=CREW_CACHE_TTL_SECONDS)
+        self._crew_cache_lock = threading.Lock()
+        self._crew_in_flight = {}
+        
+        # Event loop thread shared by all sync callers, started on first use
+        self._background_loop = None
+        self._background_loop_lock = threading.Lock()
     
     def _extract_domain_from_email(self, email: str) -> str:
-        """Extract domain from email address."""
-        return email.split('@')[1].lower()
+        """Validate an email address and return its lowercased domain."""
+        if not EMAIL_RE.match(email):
+            raise ValueError(f"Invalid email address: {email}")
+        return email[email.rfind('@') + 1:].lower()
+    
+    def _categorize_fields(self, fields: List[EnrichmentField]) -> Tuple[FrozenSet[FieldType], List[EnrichmentField]]:
+        """Return the field types present, plus the fields left to the general agent."""
+        present_types = frozenset(field.type for field in fields)
+        general_fields = [field for field in fields if field.type is FieldType.GENERAL]
+        return present_types, general_fields
     
-    def _categorize_fields(self, fields: List[EnrichmentField]) -> dict:
-        """Categorize fields by agent type."""
-        categorized = {
-            FieldType.DISCOVERY: [],
-            FieldType.COMPANY_PROFILE: [],
-            FieldType.FUNDING: [],
-            FieldType.TECH_STACK: [],
-            FieldType.METRICS: [],
-            FieldType.GENERAL: []
-        }
-        
-        for field in fields:
-            categorized[field.type].append(field)
-        
-        return categorized
+    def _crew_cache_key(self, agent_key: str, domain: str, context: str = "",
+                        fields: List[EnrichmentField] = ()) -> tuple:
+        """Key a crew result on everything its task depends on apart from the email itself."""
+        return (agent_key, domain, context, tuple((field.name, field.description) for field in fields))
     
-    def _build_context_string(self, results: dict) -> str:
-        """Build context string from previous agent results."""
-        context_parts = []
-        
-        if results.get('discovery'):
-            discovery = results['discovery']
-            context_parts.append(f"Company: {discovery.company_name}")
-            if discovery.website:
-                context_parts.append(f"Website: {discovery.website}")
-            if discovery.description:
-                context_parts.append(f"Description: {discovery.description}")
-        
-        if results.get('company_profile'):
-            profile = results['company_profile']
-            if profile.industry:
-                context_parts.append(f"Industry: {profile.industry}")
-            if profile.company_size:
-                context_parts.append(f"Size: {profile.company_size}")
-        
-        return "\n".join(context_parts)
+    def _crew_builder(self, agent_key: str, *task_args) -> Callable[[], tuple]:
+        """Return a callable creating agent_key's agent and task from task_args."""
+        return lambda: (_get_agent_factory(agent_key)(), _get_task_factory(agent_key)(*task_args))
+    
+    async def _run_crew_async(self, build_crew: Callable[[], tuple], cache_key: tuple):
+        """
+        Run a single-agent crew in a worker thread, since CrewAI's kickoff blocks.
+        
+        build_crew returns the (agent, task) pair and is only called on a cache
+        miss, so cached results skip creating CrewAI agents and tasks entirely.
+        Transient API failures are retried for this crew alone, so earlier
+        stages are not redone. Results are cached under cache_key, so other leads on the same domain
+        with the same context skip the LLM and scraping calls. Concurrent
+        callers with the same key (e.g. two CSV uploads sharing a company)
+        wait for the crew already running instead of starting another.
+        """
+        with self._crew_cache_lock:
+            cached = self._crew_cache.get(cache_key)
+            in_flight = None if cached is not None else self._crew_in_flight.get(cache_key)
+            if cached is None and in_flight is None:
+                shared = self._crew_in_flight[cache_key] = concurrent.futures.Future()
+        if cached is not None:
+            return cached
+        if in_flight is not None:
+            # Shield so one waiter giving up does not cancel the result for the others
+            return await asyncio.shield(asyncio.wrap_future(in_flight))
+        
+        try:
+            from crewai import Crew, Process
+            
+            agent, task = build_crew()
+            crew = Crew(
+                agents=[agent],
+                tasks=[task],
+                process=Process.sequential,
+                verbose=VERBOSE
+            )
+            # Run on the background loop so the shared result never depends on the caller's loop,
+            # which a sync call made on that loop's thread would block
+            kickoff = asyncio.run_coroutine_threadsafe(_kickoff_with_retry(crew), self._get_background_loop())
+        except Exception as e:
+            with self._crew_cache_lock:
+                del self._crew_in_flight[cache_key]
+            shared.set_exception(e)
+            raise
+        
+        kickoff.add_done_callback(lambda done: self._finish_crew(cache_key, shared, done))
+        return await asyncio.shield(asyncio.wrap_future(shared))
+    
+    def _finish_crew(self, cache_key: tuple, shared: concurrent.futures.Future, kickoff: concurrent.futures.Future):
+        """Cache a finished kickoff and hand its outcome to any waiting callers."""
+        failed = kickoff.cancelled() or kickoff.exception() is not None
+        with self._crew_cache_lock:
+            del self._crew_in_flight[cache_key]
+            if not failed:
+                self._crew_cache[cache_key] = kickoff.result()
+        
+        if kickoff.cancelled():
+            shared.cancel()
+        elif failed:
+            shared.set_exception(kickoff.exception())
+        else:
+            shared.set_result(kickoff.result())
     
     async def enrich_email(self, email: str, fields: List[EnrichmentField]) -> EnrichmentResult:
         """
         Enrich an email with company data using the specified fields.
         
+        Discovery and company profile run first; the funding, tech stack,
+        metrics and general agents then run concurrently on that context.
+        
         Args:
             email: Email address to enrich
             fields: List of fields to extract
@@ -104,102 +292,64 @@ class LeadEnricher:
             fields=fields
         )
         
-        categorized_fields = self._categorize_fields(fields)
+        present_types, general_fields = self._categorize_fields(fields)
         results = {}
         errors = []
         
         try:
-            if categorized_fields[FieldType.DISCOVERY] or any(categorized_fields.values()):
-                discovery_agent = create_discovery_agent()
-                discovery_task = create_discovery_task(email_context)
-                
-                discovery_crew = Crew(
-                    agents=[discovery_agent],
-                    tasks=[discovery_task],
-                    process=Process.sequential,
-                    verbose=True
+            # Stage 1: discovery, then the company profile built on its findings
+            context_builder = ContextBuilder()
+            if present_types:
+                results['discovery'] = await self._run_crew_async(
+                    self._crew_builder('discovery', email_context), self._crew_cache_key('discovery', domain)
                 )
-                
-                discovery_result = discovery_crew.kickoff()
-                results['discovery'] = discovery_result
+                if results['discovery']:
+                    context_builder.add_discovery(results['discovery'])
             
-            context = self._build_context_string(results)
+            context = context_builder.render()
             
-            if categorized_fields[FieldType.COMPANY_PROFILE]:
-                profile_agent = create_company_profile_agent()
-                profile_task = create_company_profile_task(email_context, context)
-                
-                profile_crew = Crew(
-                    agents=[profile_agent],
-                    tasks=[profile_task],
-                    process=Process.sequential,
-                    verbose=True
+            if FieldType.COMPANY_PROFILE in present_types:
+                results['company_profile'] = await self._run_crew_async(
+                    self._crew_builder('company_profile', email_context, context),
+                    self._crew_cache_key('company_profile', domain, context)
                 )
-                
-                profile_result = profile_crew.kickoff()
-                results['company_profile'] = profile_result
-                context = self._build_context_string(results)
+                if results['company_profile']:
+                    context_builder.add_company_profile(results['company_profile'])
+                    context = context_builder.render()
             
-            if categorized_fields[FieldType.FUNDING]:
-                funding_agent = create_funding_agent()
-                funding_task = create_funding_task(email_context, context)
-                
-                funding_crew = Crew(
-                    agents=[funding_agent],
-                    tasks=[funding_task],
-                    process=Process.sequential,
-                    verbose=True
-                )
-                
-                funding_result = funding_crew.kickoff()
-                results['funding'] = funding_result
-                context = self._build_context_string(results)
+            # Stage 2: the remaining agents only depend on the stage 1 context, so run them together
+            stage_two = {}
             
-            if categorized_fields[FieldType.TECH_STACK]:
-                tech_agent = create_tech_stack_agent()
-                tech_task = create_tech_stack_task(email_context, context)
-                
-                tech_crew = Crew(
-                    agents=[tech_agent],
-                    tasks=[tech_task],
-                    process=Process.sequential,
-                    verbose=True
-                )
-                
-                tech_result = tech_crew.kickoff()
-                results['tech_stack'] = tech_result
-                context = self._build_context_string(results)
+            for field_type in (FieldType.FUNDING, FieldType.TECH_STACK, FieldType.METRICS):
+                if field_type in present_types:
+                    stage_two[field_type.value] = (
+                        self._crew_builder(field_type.value, email_context, context),
+                        self._crew_cache_key(field_type.value, domain, context)
+                    )
             
-            if categorized_fields[FieldType.METRICS]:
-                metrics_agent = create_metrics_agent()
-                metrics_task = create_metrics_task(email_context, context)
-                
-                metrics_crew = Crew(
-                    agents=[metrics_agent],
-                    tasks=[metrics_task],
-                    process=Process.sequential,
-                    verbose=True
+            if general_fields:
+                stage_two['general'] = (
+                    self._crew_builder('general', email_context, general_fields, context),
+                    self._crew_cache_key('general', domain, context, general_fields)
                 )
-                
-                metrics_result = metrics_crew.kickoff()
-                results['metrics'] = metrics_result
-                context = self._build_context_string(results)
             
-            if categorized_fields[FieldType.GENERAL]:
-                general_agent = create_general_agent()
-                general_task = create_general_task(email_context, categorized_fields[FieldType.GENERAL], context)
-                
-                general_crew = Crew(
-                    agents=[general_agent],
-                    tasks=[general_task],
-                    process=Process.sequential,
-                    verbose=True
+            if stage_two:
+                stage_two_results = await asyncio.gather(
+                    *(self._run_crew_async(build_crew, cache_key) for build_crew, cache_key in stage_two.values()),
+                    return_exceptions=True
                 )
                 
-                general_result = general_crew.kickoff()
-                results['general'] = general_result
+                # A failing crew only loses its own fields; the others are still reported
+                for key, outcome in zip(stage_two, stage_two_results):
+                    # A cancelled shared crew comes back as CancelledError, which is not an Exception
+                    if isinstance(outcome, BaseException):
+                        logger.warning("%s crew failed for %s: %s", key, domain, outcome)
+                        errors.append(f"Error during {key} enrichment: {str(outcome) or type(outcome).__name__}")
+                    else:
+                        results[key] = outcome
         
         except Exception as e:
+            logger.warning("Enrichment failed for %s: %s", email, e)
             errors.append(f"Error during enrichment: {str(e)}")
         
         confidence_scores = []
@@ -224,6 +374,36 @@ class LeadEnricher:
             errors=errors
         )
     
+    def _get_background_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the background event loop, starting its daemon thread on first use."""
+        with self._background_loop_lock:
+            if self._background_loop is None:
+                loop = _LOOP_FACTORY() if _LOOP_FACTORY else asyncio.new_event_loop()
+                # Every crew kickoff runs in this loop's executor, so size it rather than take the CPU-based default
+                loop.set_default_executor(concurrent.futures.ThreadPoolExecutor(max_workers=THREADPOOL_SIZE))
+                threading.Thread(target=loop.run_forever, name="lead-enricher-loop", daemon=True).start()
+                self._background_loop = loop
+            return self._background_loop
+    
+    def _run_coro(self, coro):
+        """
+        Run a coroutine to completion from synchronous code.
+        
+        Every sync caller shares the one background loop, so no loop is created
+        per call and callers already inside an event loop do not hit
+        asyncio.run's "cannot be called from a running event loop" error.
+        """
+        loop = self._get_background_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            coro.close()
+            raise RuntimeError("Synchronous LeadEnricher methods cannot be called from its own background loop")
+        
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+    
     def enrich_email_sync(self, email: str, fields: List[EnrichmentField]) -> EnrichmentResult:
         """
         Synchronous version of enrich_email for easier usage.
@@ -235,8 +415,7 @@ class LeadEnricher:
         Returns:
             EnrichmentResult with extracted data
         """
-        import asyncio
-        return asyncio.run(self.enrich_email(email, fields))
+        return self._run_coro(self.enrich_email(email, fields))
     
     def _validate_decision_maker(self, row: LeadCSVRow) -> DecisionMakerValidation:
         """Validate if person is a decision maker based on seniority and title."""
@@ -348,138 +527,147 @@ class LeadEnricher:
             research_notes=research_notes
         )
     
-    def _save_lead_csv_results(self, results: List[LeadCSVRow], output_path: str):
-        """Save lead processing results to CSV file."""
-        import pandas as pd
+    def _lead_row_to_dict(self, result: LeadCSVRow) -> dict:
+        """Flatten a processed lead into an output CSV row."""
+        row = dict(zip(LEAD_COLUMN_ATTRS, _get_lead_column_values(result)))
+        row["Seniority_Title"] = result.seniority_title or f"{result.seniority} - {result.linkedin_headline or 'N/A'}"
+        row["Sunbiz_Data"] = str(result.sunbiz_data) if result.sunbiz_data else None
+        return row
+    
+    @contextmanager
+    def _lead_csv_writer(self, output_path: Optional[str]):
+        """Open a CSV writer for lead output rows, or yield None when no output path is given."""
+        if not output_path:
+            yield None
+            return
         
-        rows = []
-        for result in results:
-            row = {
-                "organization_name": result.organization_name,
-                "First_Name": result.first_name,
-                "Last_Name": result.last_name,
-                "Seniority_Title": result.seniority_title or f"{result.seniority} - {result.linkedin_headline or 'N/A'}",
-                "Email": result.email,
-                "Personal_Email_1": result.personal_email_1,
-                "Company_Description": result.company_description,
-                "Linkedin_Url": result.linkedin_url,
-                "Organization_Linkedin_Url": result.organization_linkedin_url,
-                "Org_Website_Url": result.org_website_url,
-                "Org_Phone": result.org_phone,
-                "Is_Decision_Maker": result.is_decision_maker,
-                "Sunbiz_Data": str(result.sunbiz_data) if result.sunbiz_data else None
-            }
-            rows.append(row)
-        
-        df = pd.DataFrame(rows)
-        df.to_csv(output_path, index=False)
+        with open(output_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, **LEAD_CSV_WRITE_OPTIONS)
+            writer.writeheader()
+            yield writer
     
-    def process_lead_csv(self, csv_file_path: str, output_path: Optional[str] = None) -> LeadProcessingResult:
-        """Process lead CSV with advanced cleaning and research."""
-        import pandas as pd
+    def _group_leads_by_company(self, df) -> dict:
+        """Group lead rows by organization name, skipping rows without one."""
         from collections import defaultdict
         
-        try:
-            df = pd.read_csv(csv_file_path)
-            results = []
-            validation_results = []
-            errors = []
+        company_groups = defaultdict(list)
+        for row in df.to_dict(orient='records'):
+            if not row.get('organization_name'):
+                continue
+            company_groups[row['organization_name']].append(row)
+        return company_groups
+    
+    def _process_company_leads(self, company_name: str, company_rows: List[dict], stats: dict,
+                               validation_results: List[DecisionMakerValidation]) -> List[LeadCSVRow]:
+        """Validate, describe and research the leads of a single company."""
+        results = []
+        company_decision_makers = []
+        company_results = []
+        
+        for row_dict in company_rows:
+            lead_row = LeadCSVRow(**row_dict)
+            lead_row.raw_data = row_dict
             
-            company_groups = defaultdict(list)
-            for index, row in df.iterrows():
-                if pd.isna(row.get('organization_name')) or not row.get('organization_name'):
-                    continue
-                company_groups[row['organization_name']].append((index, row))
+            validation = self._validate_decision_maker(lead_row)
+            validation_results.append(validation)
             
-            decision_makers_count = 0
-            emails_researched = 0
-            descriptions_created = 0
-            sunbiz_lookups = 0
+            if validation.is_decision_maker:
+                company_decision_makers.append((lead_row, validation))
             
-            for company_name, company_rows in company_groups.items():
-                try:
-                    company_decision_makers = []
-                    company_results = []
-                    
-                    for index, row in company_rows:
-                        row_dict = row.to_dict()
-                        for key, value in row_dict.items():
-                            if pd.isna(value):
-                                row_dict[key] = None
-                        
-                        lead_row = LeadCSVRow(**row_dict)
-                        lead_row.raw_data = row_dict
-                        
-                        validation = self._validate_decision_maker(lead_row)
-                        validation_results.append(validation)
-                        
-                        if validation.is_decision_maker:
-                            company_decision_makers.append((lead_row, validation))
-                        
-                        company_results.append((lead_row, validation))
-                    
-                    if not company_decision_makers:
-                        decision_maker_row = self._research_company_decision_maker(company_name, company_results[0][0])
-                        if decision_maker_row:
-                            decision_maker_validation = DecisionMakerValidation(
-                                is_decision_maker=True,
-                                confidence_score=0.7,
-                                reasoning="Researched decision maker for company",
-                                seniority_level="researched",
-                                job_title="Decision Maker"
-                            )
-                            company_decision_makers.append((decision_maker_row, decision_maker_validation))
-                            company_results[0] = (decision_maker_row, decision_maker_validation)
-                    
-                    for lead_row, validation in company_results:
-                        if validation.is_decision_maker or lead_row in [dm[0] for dm in company_decision_makers]:
-                            decision_makers_count += 1
-                            
-                            lead_row.company_description = self._consolidate_company_description(lead_row)
-                            descriptions_created += 1
-                            
-                            lead_row.seniority_title = f"{lead_row.seniority} - {lead_row.linkedin_headline or 'N/A'}"
-                            
-                            if not lead_row.email or not lead_row.personal_email_1:
-                                email_research = self._research_missing_emails(lead_row)
-                                if email_research.email_found and not lead_row.email:
-                                    lead_row.email = email_research.email_found
-                                if email_research.personal_email_found and not lead_row.personal_email_1:
-                                    lead_row.personal_email_1 = email_research.personal_email_found
-                                emails_researched += 1
-                            
-                            if any(indicator in lead_row.organization_name.lower() for indicator in ["fl", "florida"]):
-                                try:
-                                    sunbiz_tool = SunbizScraperTool()
-                                    sunbiz_result = sunbiz_tool._run(lead_row.organization_name)
-                                    lead_row.sunbiz_data = {"search_result": sunbiz_result}
-                                    sunbiz_lookups += 1
-                                except Exception as e:
-                                    lead_row.sunbiz_data = {"error": str(e)}
-                        
-                        lead_row.is_decision_maker = validation.is_decision_maker
-                        results.append(lead_row)
+            company_results.append((lead_row, validation))
+        
+        if not company_decision_makers:
+            decision_maker_row = self._research_company_decision_maker(company_name, company_results[0][0])
+            if decision_maker_row:
+                company_decision_makers.append((decision_maker_row, RESEARCHED_DECISION_MAKER_VALIDATION))
+                company_results[0] = (decision_maker_row, RESEARCHED_DECISION_MAKER_VALIDATION)
+        
+        for lead_row, validation in company_results:
+            if validation.is_decision_maker or lead_row in [dm[0] for dm in company_decision_makers]:
+                stats["decision_makers_found"] += 1
+                
+                lead_row.company_description = self._consolidate_company_description(lead_row)
+                stats["company_descriptions_created"] += 1
+                
+                lead_row.seniority_title = f"{lead_row.seniority} - {lead_row.linkedin_headline or 'N/A'}"
+                
+                if not lead_row.email or not lead_row.personal_email_1:
+                    email_research = self._research_missing_emails(lead_row)
+                    if email_research.email_found and not lead_row.email:
+                        lead_row.email = email_research.email_found
+                    if email_research.personal_email_found and not lead_row.personal_email_1:
+                        lead_row.personal_email_1 = email_research.personal_email_found
+                    stats["emails_researched"] += 1
+                
+                if any(indicator in lead_row.organization_name.lower() for indicator in ["fl", "florida"]):
+                    try:
+                        from .tools.sunbiz_scraper import SunbizScraperTool
                         
-                except Exception as e:
-                    errors.append(f"Company {company_name}: {str(e)}")
+                        sunbiz_tool = SunbizScraperTool()
+                        sunbiz_result = sunbiz_tool._run(lead_row.organization_name)
+                        lead_row.sunbiz_data = {"search_result": sunbiz_result}
+                        stats["sunbiz_lookups"] += 1
+                    except Exception as e:
+                        lead_row.sunbiz_data = {"error": str(e)}
             
-            if output_path:
-                self._save_lead_csv_results(results, output_path)
+            lead_row.is_decision_maker = validation.is_decision_maker
+            results.append(lead_row)
+        
+        return results
+    
+    def process_lead_csv(self, csv_file_path: str, output_path: Optional[str] = None) -> LeadProcessingResult:
+        """Process lead CSV with advanced cleaning and research."""
+        return self._run_coro(self.process_lead_csv_async(csv_file_path, output_path))
+    
+    def iter_lead_csv(self, csv_file_path: str, chunksize: int = 100) -> Iterator[dict]:
+        """
+        Process a lead CSV in chunks, yielding output CSV rows as they are ready.
+        
+        Only one chunk is held in memory at a time, plus the rows of a company
+        that continues into it. A company's leads are processed together as long
+        as its rows are contiguous, so input sorted by organization_name produces
+        the same rows as process_lead_csv_async.
+        
+        Args:
+            csv_file_path: Path to the input lead CSV
+            chunksize: Number of input rows read per chunk
             
-            return LeadProcessingResult(
-                total_rows=len(df),
-                processed_rows=len(results),
-                decision_makers_found=decision_makers_count,
-                emails_researched=emails_researched,
-                company_descriptions_created=descriptions_created,
-                sunbiz_lookups=sunbiz_lookups,
-                results=results,
-                validation_results=validation_results,
-                errors=errors
-            )
+        Yields:
+            Output rows in the same format written by process_lead_csv
+        """
+        import pandas as pd
+        
+        chunks = pd.read_csv(csv_file_path, chunksize=chunksize, **LEAD_CSV_READ_OPTIONS)
+        stats = dict.fromkeys(LEAD_STAT_KEYS, 0)
+        for company_name, company_rows in self._iter_company_groups(chunks):
+            try:
+                company_results = self._process_company_leads(company_name, company_rows, stats, [])
+            except Exception as e:
+                # Failed companies are left out, as in process_lead_csv_async's results
+                logger.warning("Lead processing failed for company %s: %s", company_name, e)
+                continue
+            for result in company_results:
+                yield self._lead_row_to_dict(result)
+    
+    def _iter_company_groups(self, chunks) -> Iterator[Tuple[str, List[dict]]]:
+        """Group chunked lead rows by company, joining a company whose rows cross a chunk boundary."""
+        held_name, held_rows = None, []
+        for chunk in chunks:
+            company_groups = self._group_leads_by_company(chunk)
+            if held_name is not None:
+                held_rows.extend(company_groups.pop(held_name, []))
+                groups = [(held_name, held_rows), *company_groups.items()]
+            else:
+                groups = list(company_groups.items())
+            if not groups:
+                continue
             
-        except Exception as e:
-            raise ValueError(f"Error processing lead CSV file: {str(e)}")
+            # The chunk's last company may continue in the next chunk, so hold it back
+            held_name, held_rows = groups.pop()
+            yield from groups
+        
+        if held_name is not None:
+            yield held_name, held_rows
     
     def _research_company_decision_maker(self, company_name: str, sample_row: LeadCSVRow) -> Optional[LeadCSVRow]:
         """Research and find actual decision maker for company when none exist."""
@@ -503,6 +691,65 @@ class LeadEnricher:
         return None
     
     async def process_lead_csv_async(self, csv_file_path: str, output_path: Optional[str] = None) -> LeadProcessingResult:
-        """Asynchronous version of lead CSV processing."""
-        import asyncio
-        return await asyncio.get_event_loop().run_in_executor(None, self.process_lead_csv, csv_file_path, output_path)
+        """
+        Asynchronous version of lead CSV processing.
+        
+        Companies are processed concurrently, at most LEAD_CSV_CONCURRENCY at a
+        time, each in a worker thread since the per-company research blocks.
+        Results and output rows are in input company order.
+        """
+        import pandas as pd
+        
+        try:
+            df = await asyncio.to_thread(pd.read_csv, csv_file_path, **LEAD_CSV_READ_OPTIONS)
+            semaphore = asyncio.Semaphore(LEAD_CSV_CONCURRENCY)
+            
+            async def process_company(company_name: str, company_rows: list) -> tuple:
+                """Process one company with its own counters, capturing any failure."""
+                company_stats = dict.fromkeys(LEAD_STAT_KEYS, 0)
+                company_validations = []
+                try:
+                    async with semaphore:
+                        company_results = await asyncio.to_thread(
+                            self._process_company_leads, company_name, company_rows, company_stats, company_validations
+                        )
+                    return company_results, company_stats, company_validations, None
+                except Exception as e:
+                    logger.warning("Lead processing failed for company %s: %s", company_name, e)
+                    return [], company_stats, company_validations, f"Company {company_name}: {str(e)}"
+            
+            results = []
+            validation_results = []
+            errors = []
+            stats = dict.fromkeys(LEAD_STAT_KEYS, 0)
+            
+            with self._lead_csv_writer(output_path) as writer:
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [
+                        tg.create_task(process_company(company_name, company_rows))
+                        for company_name, company_rows in self._group_leads_by_company(df).items()
+                    ]
+                    
+                    # Collect in company order, writing each company's rows once it and all before it are done
+                    for task in tasks:
+                        company_results, company_stats, company_validations, error = await task
+                        results.extend(company_results)
+                        validation_results.extend(company_validations)
+                        for key, count in company_stats.items():
+                            stats[key] += count
+                        if error:
+                            errors.append(error)
+                        if writer:
+                            writer.writerows(map(self._lead_row_to_dict, company_results))
+            
+            return LeadProcessingResult(
+                total_rows=len(df),
+                processed_rows=len(results),
+                **stats,
+                results=results,
+                validation_results=validation_results,
+                errors=errors
+            )
+            
+        except Exception as e:
+            raise ValueError(f"Error processing lead CSV file: {str(e)}")
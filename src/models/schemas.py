@@ -15,6 +15,9 @@ class EnrichmentField(BaseModel):
     type: FieldType
     description: str
     required: bool = False
+    
+    # Instances are cached and shared between requests
+    model_config = {"frozen": True}
 
 class EmailContext(BaseModel):
     email: str
@@ -123,6 +126,9 @@ class DecisionMakerValidation(BaseModel):
     reasoning: str
     seniority_level: str
     job_title: Optional[str] = None
+    
+    # Shared constant instances are reused across leads
+    model_config = {"frozen": True}
 
 class EmailResearchResult(BaseModel):
     email_found: Optional[str] = None
@@ -0,0 +1,25 @@
+import os
+import re
+
+# Basic shape check used to reject malformed addresses before any enrichment work
+EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+_DOMAINS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "public_email_domains.txt")
+
+_DEFAULT_DOMAINS = {
+    "gmail.com", "yahoo.com", "hotmail.com", "outlook.com",
+    "aol.com", "icloud.com", "proton.me", "protonmail.com"
+}
+
+def _load_public_email_domains() -> frozenset:
+    """Load personal email provider domains, skipping blank lines and comments."""
+    try:
+        with open(_DOMAINS_FILE, encoding="utf-8") as f:
+            return frozenset(
+                line.strip().lower() for line in f
+                if line.strip() and not line.strip().startswith("#")
+            )
+    except OSError:
+        return frozenset(_DEFAULT_DOMAINS)
+
+PUBLIC_EMAIL_DOMAINS = _load_public_email_domains()
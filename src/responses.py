@@ -0,0 +1,28 @@
+from typing import Any, Dict
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib json module."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Frames are yielded as pre-encoded UTF-8 bytes, so declare the charset once here
+SSE_MEDIA_TYPE = "text/event-stream; charset=utf-8"
+
+# Headers for SSE responses; X-Accel-Buffering stops nginx-style proxies buffering events
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "Access-Control-Allow-Origin": "*",
+    "X-Accel-Buffering": "no",
+}
+
+
+def sse(payload: Dict[str, Any]) -> bytes:
+    """Encode a payload as a Server-Sent Events frame."""
+    return b"data: " + orjson.dumps(payload) + b"\n\n"
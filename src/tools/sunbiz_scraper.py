@@ -1,3 +1,5 @@
+import atexit
+import threading
 import time
 from typing import Optional, Dict, Any
 from selenium import webdriver
@@ -5,51 +7,86 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from crewai_tools import BaseTool
 
+# One headless Chrome is shared by every lookup, since launching it dominates a search.
+# A WebDriver session is not thread safe, so lookups take turns under the lock.
+_driver = None
+_driver_lock = threading.Lock()
+
+
+def _create_driver():
+    """Launch the headless Chrome used for Sunbiz searches."""
+    options = Options()
+    options.add_argument('--headless')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--window-size=1920,1080')
+    
+    return webdriver.Chrome(options=options)
+
+
+def _discard_driver():
+    """Quit the shared driver; the next lookup launches a fresh one. Caller holds the lock."""
+    global _driver
+    if _driver is not None:
+        try:
+            _driver.quit()
+        except Exception:
+            pass
+        _driver = None
+
+
+def close_shared_driver():
+    """Quit the shared Chrome instance, if one was started."""
+    with _driver_lock:
+        _discard_driver()
+
+
+atexit.register(close_shared_driver)
+
+
 class SunbizScraperTool(BaseTool):
     name: str = "sunbiz_business_search"
     description: str = "Search Florida business registry (Sunbiz) for company information"
     
     def _run(self, company_name: str, **kwargs) -> str:
         """Search Sunbiz for company information using interactive workflow."""
-        try:
-            options = Options()
-            options.add_argument('--headless')
-            options.add_argument('--no-sandbox')
-            options.add_argument('--disable-dev-shm-usage')
-            options.add_argument('--disable-gpu')
-            options.add_argument('--window-size=1920,1080')
-            
-            driver = webdriver.Chrome(options=options)
-            
-            driver.get("https://dos.fl.gov/sunbiz/search/")
-            wait = WebDriverWait(driver, 15)
-            
+        global _driver
+        with _driver_lock:
             try:
-                name_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Name")))
-                name_link.click()
+                if _driver is None:
+                    _driver = _create_driver()
+                driver = _driver
                 
-                search_input = wait.until(EC.presence_of_element_located((By.NAME, "SearchTerm")))
-                search_input.clear()
-                search_input.send_keys(company_name)
+                driver.get("https://dos.fl.gov/sunbiz/search/")
+                wait = WebDriverWait(driver, 15)
                 
-                search_button = driver.find_element(By.NAME, "Search")
-                search_button.click()
-                
-                time.sleep(3)
-                results = self._select_and_scrape_company_details(driver, company_name)
-                
-                driver.quit()
-                return results
-                
-            except TimeoutException:
-                driver.quit()
-                return f"Timeout searching Sunbiz for {company_name}"
-                
-        except Exception as e:
-            return f"Error in Sunbiz interactive search for {company_name}: {str(e)}"
+                try:
+                    name_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Name")))
+                    name_link.click()
+                    
+                    search_input = wait.until(EC.presence_of_element_located((By.NAME, "SearchTerm")))
+                    search_input.clear()
+                    search_input.send_keys(company_name)
+                    
+                    search_button = driver.find_element(By.NAME, "Search")
+                    search_button.click()
+                    
+                    time.sleep(3)
+                    return self._select_and_scrape_company_details(driver, company_name)
+                    
+                except TimeoutException:
+                    return f"Timeout searching Sunbiz for {company_name}"
+                    
+            except WebDriverException as e:
+                # The browser session may be dead; relaunch it on the next lookup
+                _discard_driver()
+                return f"Error in Sunbiz interactive search for {company_name}: {str(e)}"
+            except Exception as e:
+                return f"Error in Sunbiz interactive search for {company_name}: {str(e)}"
     
     def _select_and_scrape_company_details(self, driver, company_name: str) -> str:
         """Select first active company from results and scrape detailed information."""
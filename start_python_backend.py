@@ -3,11 +3,14 @@
 Quick script to start the Python backend server.
 """
 
-import subprocess
+import importlib.util
+import logging
 import sys
 import os
 
 def main():
+    logging.basicConfig(handlers=[logging.StreamHandler()], level=logging.WARNING)
+    
     print("🔥 Starting Fire Enrich Python Backend...")
     print("📍 Advanced CrewAI multi-agent system")
     print("🚀 Starting server on http://127.0.0.1:8000")
@@ -33,22 +36,31 @@ def main():
             server_module = "src.api_server:app"
             print("🚀 Using full CrewAI backend")
         
-        # Start the FastAPI server
-        cmd = [
-            sys.executable, "-m", "uvicorn", 
-            server_module, 
-            "--reload", 
-            "--port", "8000",
-            "--host", "127.0.0.1"
-        ]
+        # Reload is for development; with it off, serve from one worker per CPU
+        reload = os.getenv("LEADENRICHER_RELOAD", "1") == "1"
+        options = {
+            "host": "127.0.0.1",
+            "port": 8000,
+            "reload": reload,
+            "workers": 1 if reload else os.cpu_count(),
+            "log_level": "info",
+        }
+        
+        # uvloop and httptools are much faster than the defaults but are not available on Windows
+        if sys.platform != "win32" and importlib.util.find_spec("uvloop"):
+            options["loop"] = "uvloop"
+        if importlib.util.find_spec("httptools"):
+            options["http"] = "httptools"
         
-        print(f"Running: {' '.join(cmd)}")
+        print(f"Running: uvicorn {server_module} {options}")
         print()
-        subprocess.run(cmd, check=True)
+        
+        import uvicorn
+        uvicorn.run(server_module, **options)
         
     except KeyboardInterrupt:
         print("\n\n🛑 Server stopped by user")
-    except subprocess.CalledProcessError as e:
+    except (ImportError, OSError) as e:
         print(f"\n❌ Error starting server: {e}")
         print("\n🔧 Troubleshooting:")
         print("1. Install dependencies: pip install -r requirements.txt")
@@ -4,6 +4,7 @@ Test enhanced CSV processing functionality with sample lead data.
 """
 
 import os
+import tempfile
 import pandas as pd
 from src.models.schemas import LeadCSVRow, DecisionMakerValidation, LeadProcessingResult
 from src.lead_enricher import LeadEnricher
@@ -175,6 +176,36 @@ def test_sample_csv_processing():
         print(f"❌ Sample CSV processing failed: {e}")
         return False
 
+def test_streamed_company_across_chunks():
+    """Test that streaming keeps a company's leads together when they span chunks."""
+    print("Testing streamed company across chunks...")
+    
+    os.environ["OPENAI_API_KEY"] = "test-key"
+    os.environ["FIRECRAWL_API_KEY"] = "test-key"
+    
+    enricher = LeadEnricher()
+    rows = pd.DataFrame({
+        'organization_name': ['Acme', 'Acme', 'Acme', 'Beta'],
+        'First_Name': ['A', 'B', 'C', 'D'],
+        'Last_Name': ['Lee', 'Ray', 'Kim', 'Fox'],
+        'Seniority': ['c_suite', 'entry', 'entry', 'c_suite'],
+        'Linkedin_Headline': ['CEO', 'Analyst', 'Analyst', 'Owner'],
+        'Org_Website_Url': ['https://acme.com', 'https://acme.com', 'https://acme.com', 'https://beta.com']
+    })
+    
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'leads.csv')
+        rows.to_csv(csv_path, index=False)
+        
+        expected = [enricher._lead_row_to_dict(row) for row in enricher.process_lead_csv(csv_path).results]
+        streamed = list(enricher.iter_lead_csv(csv_path, chunksize=2))
+    
+    assert [row['First_Name'] for row in streamed] == ['A', 'B', 'C', 'D']
+    assert streamed == expected
+    
+    print("✓ Streamed company across chunks working correctly")
+    return True
+
 def main():
     """Run all enhanced CSV processing tests."""
     print("🧪 Testing Enhanced CSV Processing Functionality")
@@ -184,7 +215,8 @@ def main():
         test_lead_csv_row_creation,
         test_decision_maker_validation,
         test_company_description_consolidation,
-        test_sample_csv_processing
+        test_sample_csv_processing,
+        test_streamed_company_across_chunks
     ]
     
     passed = 0
@@ -4,8 +4,14 @@ Simple test to verify the Lead Enricher works without requiring API keys.
 This tests the structure and import flow without making actual API calls.
 """
 
+import asyncio
 import os
-from src.models.schemas import EnrichmentField, FieldType
+import sys
+import threading
+import time
+import types
+from contextlib import contextmanager
+from src.models.schemas import DiscoveryResult, EnrichmentField, FieldType
 from src.lead_enricher import LeadEnricher
 
 def test_enricher_initialization():
@@ -54,12 +60,13 @@ def test_field_categorization():
     ]
     
     try:
-        categorized = enricher._categorize_fields(fields)
+        present_types, general_fields = enricher._categorize_fields(fields)
         
-        assert len(categorized[FieldType.DISCOVERY]) == 1
-        assert len(categorized[FieldType.COMPANY_PROFILE]) == 1
-        assert len(categorized[FieldType.FUNDING]) == 1
-        assert len(categorized[FieldType.TECH_STACK]) == 0
+        assert FieldType.DISCOVERY in present_types
+        assert FieldType.COMPANY_PROFILE in present_types
+        assert FieldType.FUNDING in present_types
+        assert FieldType.TECH_STACK not in present_types
+        assert general_fields == []
         
         print("✓ Field categorization working correctly")
         return True
@@ -93,6 +100,211 @@ def test_domain_extraction():
         print(f"❌ Domain extraction failed: {e}")
         return False
 
+def test_malformed_email_rejected():
+    """Test that an address without a usable domain is rejected before any agent work."""
+    print("Testing malformed email rejection...")
+    
+    os.environ["OPENAI_API_KEY"] = "test-key"
+    os.environ["FIRECRAWL_API_KEY"] = "test-key"
+    
+    enricher = LeadEnricher()
+    
+    for email in ["not-an-email", "someone@", "a@b"]:
+        try:
+            enricher._extract_domain_from_email(email)
+        except ValueError:
+            continue
+        raise AssertionError(f"Expected {email!r} to be rejected")
+    
+    print("✓ Malformed email rejection working correctly")
+    return True
+
+@contextmanager
+def _fake_crewai(crew_class):
+    """Temporarily replace the crewai module with one exposing the given Crew class."""
+    module = types.ModuleType("crewai")
+    module.Crew = crew_class
+    module.Process = types.SimpleNamespace(sequential="sequential")
+    original = sys.modules.get("crewai")
+    sys.modules["crewai"] = module
+    try:
+        yield
+    finally:
+        if original is None:
+            del sys.modules["crewai"]
+        else:
+            sys.modules["crewai"] = original
+
+def test_crew_setup_failure_releases_waiters():
+    """Test that a crew failing to start does not leave later callers waiting on it."""
+    print("Testing crew setup failure...")
+    
+    os.environ["OPENAI_API_KEY"] = "test-key"
+    os.environ["FIRECRAWL_API_KEY"] = "test-key"
+    
+    class FailingCrew:
+        def __init__(self, **kwargs):
+            raise RuntimeError("crew setup failed")
+    
+    enricher = LeadEnricher()
+    cache_key = enricher._crew_cache_key("discovery", "example.com")
+    
+    async def run():
+        outcomes = []
+        for _ in range(2):
+            try:
+                await asyncio.wait_for(enricher._run_crew_async(lambda: (None, None), cache_key), timeout=5)
+            except RuntimeError as e:
+                outcomes.append(str(e))
+        return outcomes
+    
+    with _fake_crewai(FailingCrew):
+        outcomes = asyncio.run(run())
+    
+    assert outcomes == ["crew setup failed", "crew setup failed"], outcomes
+    assert enricher._crew_in_flight == {}
+    
+    print("✓ Crew setup failure handled correctly")
+    return True
+
+def test_sync_call_during_running_crew():
+    """Test that a sync call on a loop thread can wait for a crew that loop started."""
+    print("Testing sync call during a running crew...")
+    
+    os.environ["OPENAI_API_KEY"] = "test-key"
+    os.environ["FIRECRAWL_API_KEY"] = "test-key"
+    
+    class SlowCrew:
+        def __init__(self, **kwargs):
+            pass
+        
+        def kickoff(self):
+            time.sleep(0.2)
+            return "crew result"
+    
+    enricher = LeadEnricher()
+    cache_key = enricher._crew_cache_key("discovery", "example.com")
+    results = []
+    
+    async def run():
+        first = asyncio.create_task(enricher._run_crew_async(lambda: (None, None), cache_key))
+        await asyncio.sleep(0)
+        # Blocks this loop's thread while the crew it started is still running
+        results.append(enricher._run_coro(enricher._run_crew_async(lambda: (None, None), cache_key)))
+        results.append(await first)
+    
+    with _fake_crewai(SlowCrew):
+        thread = threading.Thread(target=asyncio.run, args=(run(),), daemon=True)
+        thread.start()
+        thread.join(timeout=10)
+    
+    assert not thread.is_alive(), "Sync call deadlocked waiting for the running crew"
+    assert results == ["crew result", "crew result"], results
+    
+    print("✓ Sync call during a running crew working correctly")
+    return True
+
+def test_cached_crew_not_rebuilt():
+    """Test that a cached crew result skips building the agent and task."""
+    print("Testing cached crew build...")
+    
+    os.environ["OPENAI_API_KEY"] = "test-key"
+    os.environ["FIRECRAWL_API_KEY"] = "test-key"
+    
+    class QuickCrew:
+        def __init__(self, **kwargs):
+            pass
+        
+        def kickoff(self):
+            return "crew result"
+    
+    enricher = LeadEnricher()
+    cache_key = enricher._crew_cache_key("discovery", "example.com")
+    builds = []
+    
+    def build_crew():
+        builds.append(cache_key)
+        return None, None
+    
+    async def run():
+        return [await enricher._run_crew_async(build_crew, cache_key) for _ in range(3)]
+    
+    with _fake_crewai(QuickCrew):
+        results = asyncio.run(run())
+    
+    assert results == ["crew result"] * 3
+    assert len(builds) == 1, f"Expected one build, got {len(builds)}"
+    
+    print("✓ Cached crew build working correctly")
+    return True
+
+def test_cancelled_crew_reported_as_error():
+    """Test that a stage two crew cancelled elsewhere is reported as a failed agent."""
+    print("Testing cancelled crew...")
+    
+    os.environ["OPENAI_API_KEY"] = "test-key"
+    os.environ["FIRECRAWL_API_KEY"] = "test-key"
+    
+    enricher = LeadEnricher()
+    
+    async def fake_run_crew_async(build_crew, cache_key):
+        if cache_key[0] == "funding":
+            raise asyncio.CancelledError()
+        return DiscoveryResult(company_name="Example", domain="example.com", confidence_score=0.9)
+    
+    enricher._run_crew_async = fake_run_crew_async
+    fields = [EnrichmentField(name="funding", type=FieldType.FUNDING, description="Funding info")]
+    
+    result = asyncio.run(enricher.enrich_email("ann@example.com", fields))
+    
+    assert result.discovery is not None
+    assert result.funding is None
+    assert any("funding" in error for error in result.errors), result.errors
+    
+    print("✓ Cancelled crew handled correctly")
+    return True
+
+def test_crews_run_in_parallel():
+    """Test that concurrent crews are not limited by the default CPU-sized executor."""
+    print("Testing parallel crews...")
+    
+    os.environ["OPENAI_API_KEY"] = "test-key"
+    os.environ["FIRECRAWL_API_KEY"] = "test-key"
+    
+    lock = threading.Lock()
+    running = {"now": 0, "peak": 0}
+    
+    class CountingCrew:
+        def __init__(self, **kwargs):
+            pass
+        
+        def kickoff(self):
+            with lock:
+                running["now"] += 1
+                running["peak"] = max(running["peak"], running["now"])
+            time.sleep(0.2)
+            with lock:
+                running["now"] -= 1
+            return "crew result"
+    
+    enricher = LeadEnricher()
+    crew_count = 16
+    
+    async def run():
+        return await asyncio.gather(*(
+            enricher._run_crew_async(lambda: (None, None), enricher._crew_cache_key("discovery", f"company{i}.com"))
+            for i in range(crew_count)
+        ))
+    
+    with _fake_crewai(CountingCrew):
+        results = asyncio.run(run())
+    
+    assert results == ["crew result"] * crew_count
+    assert running["peak"] == crew_count, f"Expected {crew_count} crews at once, peaked at {running['peak']}"
+    
+    print("✓ Parallel crews working correctly")
+    return True
+
 def main():
     """Run all tests."""
     print("🧪 Running Lead Enricher Structure Tests")
@@ -101,7 +313,13 @@ def main():
     tests = [
         test_enricher_initialization,
         test_field_categorization,
-        test_domain_extraction
+        test_domain_extraction,
+        test_malformed_email_rejected,
+        test_crew_setup_failure_releases_waiters,
+        test_sync_call_during_running_crew,
+        test_cached_crew_not_rebuilt,
+        test_cancelled_crew_reported_as_error,
+        test_crews_run_in_parallel
     ]
     
     passed = 0